@@ -1,12 +1,206 @@
+from functools import lru_cache
+
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import plotly.express as px
 import plotly.graph_objects as go
-from dash import Input, Output, dcc, html
+import plotly.io as pio
+from dash import Input, Output, Patch, ctx, dcc, html
 from jupyter_dash import JupyterDash
 from plotly.subplots import make_subplots
 
+try:
+    import orjson  # noqa
+except ImportError:
+    _ORJSON_SUPPORTED = False
+else:
+    _ORJSON_SUPPORTED = True
+
+try:
+    from numba import njit
+except ImportError:
+    _NUMBA_SUPPORTED = False
+else:
+    _NUMBA_SUPPORTED = True
+
+# NOTE: figure serialization is the hot path of the Dash callbacks below;
+# orjson encodes numpy arrays natively and is much faster than the default
+# `PlotlyJSONEncoder`.
+if _ORJSON_SUPPORTED:
+    pio.json.config.default_engine = "orjson"
+
+
+if _NUMBA_SUPPORTED:
+
+    @njit(cache=True)
+    def _cost_per_activity_kernel(spend, activity):
+        # Fused loop, leaving 0 wherever the activity is 0 or the ratio is not
+        # finite
+        cpa = np.zeros_like(spend)
+        for i in range(spend.shape[0]):
+            if activity[i] != 0:
+                value = spend[i] / activity[i]
+                if np.isfinite(value):
+                    cpa[i] = value
+        return cpa
+
+else:
+
+    def _cost_per_activity_kernel(spend, activity):
+        # Single pass division, leaving 0 wherever the activity is 0 (or missing)
+        cpa = np.zeros_like(spend)
+        np.divide(spend, activity, out=cpa, where=activity != 0)
+        return np.nan_to_num(cpa, copy=False, nan=0.0, posinf=0.0, neginf=0.0)
+
+
+def _to_ns(dates):
+    # Dates as int64 nanoseconds, so that searches never cast between units
+    if np.ndim(dates) == 0:
+        return pd.Timestamp(dates).value
+    return pd.to_datetime(dates).to_numpy(dtype="datetime64[ns]").view(np.int64)
+
+
+def _as_contiguous(data, cols):
+    # Aggregated columns backed by strided (e.g. Fortran ordered) arrays are
+    # copied into contiguous ones, the frame is returned as is otherwise
+    strided = {
+        col: np.ascontiguousarray(data[col].to_numpy())
+        for col in cols
+        if not data[col].to_numpy().flags.c_contiguous
+    }
+    return data.assign(**strided) if strided else data
+
+
+def _get_cost_per_activity(spend, activity):
+    return _cost_per_activity_kernel(
+        np.ascontiguousarray(spend, dtype=np.float64),
+        np.ascontiguousarray(activity, dtype=np.float64),
+    )
+
+
+def _code_mask(codes, categories, value):
+    # Rows whose category code is that of `value`, none when `value` is not a
+    # category (a cleared dropdown sends None)
+    if value not in categories:
+        return np.zeros(len(codes), dtype=bool)
+    return codes == categories.get_loc(value)
+
+
+def _default_template():
+    # Plain dict figures skip plotly's validation of every property on each
+    # callback, so they carry the resolved default template themselves
+    return pio.templates[pio.templates.default].to_plotly_json()
+
+
+def _plot_values(values):
+    # orjson writes float32 arrays at their shortest float32 repr, which trims
+    # full precision values such as ratios. The default encoder would widen
+    # them to float64 reprs instead, so they are only cast for orjson.
+    values = np.asarray(values)
+    return values.astype(np.float32) if _ORJSON_SUPPORTED else values
+
+
+def _spend_vs_activity_figures(temp, plot_type, date_col, template):
+    # Spend vs activity and cost per activity figures as plain dicts
+    cpm_fig = {
+        "data": [
+            {
+                "type": "scattergl",
+                "mode": "lines",
+                "x": temp[date_col],
+                "y": _plot_values(temp["cost_per_act"]),
+                "name": "",
+                "showlegend": False,
+                "hovertemplate": f"{date_col}=%{{x}}<br>cost_per_act=%{{y}}"
+                "<extra></extra>",
+            }
+        ],
+        "layout": {
+            "template": template,
+            "title": {"text": " Cost per Activity "},
+            "xaxis": {"title": {"text": "Date"}},
+            "yaxis": {"title": {"text": "cost_per_act"}},
+        },
+    }
+
+    if plot_type == "Time Series":
+        fig = {
+            "data": [
+                {
+                    "type": "scattergl",
+                    "x": temp[date_col],
+                    "y": _plot_values(temp["Spend"]),
+                    "name": "Spends",
+                },
+                {
+                    "type": "scattergl",
+                    "x": temp[date_col],
+                    "y": _plot_values(temp["Activity"]),
+                    "name": "Activity",
+                    "yaxis": "y2",
+                },
+            ],
+            "layout": {
+                "template": template,
+                "title": {"text": "Spends vs. Activity"},
+                "xaxis": {"domain": [0.0, 0.94], "title": {"text": "Date"}},
+                "yaxis": {"title": {"text": "<b>Spends</b>"}},
+                "yaxis2": {
+                    "overlaying": "y",
+                    "side": "right",
+                    "title": {"text": "<b>Activity</b>"},
+                },
+            },
+        }
+
+    elif plot_type == "Scatter Plot":
+        fig = {
+            "data": [
+                {
+                    "type": "scattergl",
+                    "mode": "markers",
+                    "x": _plot_values(temp["Activity"]),
+                    "y": _plot_values(temp["Spend"]),
+                    "name": "",
+                    "showlegend": False,
+                    "hovertemplate": "Activity=%{x}<br>Spend=%{y}<extra></extra>",
+                }
+            ],
+            "layout": {
+                "template": template,
+                "title": {"text": "Scatter plot Spends vs. Activity"},
+                "xaxis": {"title": {"text": "Activity"}},
+                "yaxis": {"title": {"text": "Spend"}},
+            },
+        }
+
+    return fig, cpm_fig
+
+
+def _is_data_update():
+    # Anything but the initial call or a change of the plot type
+    return (
+        ctx.triggered_id is not None and "plot_type.value" not in ctx.triggered_prop_ids
+    )
+
+
+def _patch_spend_vs_activity_figures(temp, plot_type, date_col):
+    # Only the traces' data changes unless the plot type is switched, so
+    # update the figures in place instead of sending them over again.
+    fig, cpm_fig = Patch(), Patch()
+    cpm_fig["data"][0]["x"] = temp[date_col]
+    cpm_fig["data"][0]["y"] = _plot_values(temp["cost_per_act"])
+    if plot_type == "Time Series":
+        fig["data"][0]["x"] = temp[date_col]
+        fig["data"][0]["y"] = _plot_values(temp["Spend"])
+        fig["data"][1]["x"] = temp[date_col]
+        fig["data"][1]["y"] = _plot_values(temp["Activity"])
+    elif plot_type == "Scatter Plot":
+        fig["data"][0]["x"] = _plot_values(temp["Activity"])
+        fig["data"][0]["y"] = _plot_values(temp["Spend"])
+    return fig, cpm_fig
+
 
 def get_spend_vs_activity_plot_interact(
     data: pd.DataFrame, date_col: str, group_col: str = None, port: int = 8050
@@ -30,25 +224,74 @@ def get_spend_vs_activity_plot_interact(
         Displays a Dash app containing the spend versus activity data plot and cost per activity plot.
     """
 
-    app = JupyterDash(__name__)
+    app = JupyterDash(__name__, update_title=None)
+
+    # Filter on integer category codes rather than comparing strings
+    cat_cols = ["variable_description", "activity_type"]
+    if group_col is not None:
+        cat_cols.append(group_col)
+    data = data.assign(**{col: data[col].astype("category") for col in cat_cols})
+    # Default to the first row's pair, as the options are sorted independently
+    # and their first values need not have any data together
+    vd_default, at_default = data[["variable_description", "activity_type"]].iloc[0]
+
+    # Precompute the row indices of every (touchpoint, activity) pair once, on
+    # data sorted by date, so that the callbacks only need a binary search on
+    # the dates instead of masking the full DataFrame on every interaction.
+    # Sorting on all the aggregation keys also lets the groupbys skip sorting.
+    keys = [date_col, "variable_activity_root", "variable_description", "activity_type"]
+    data = data.sort_values(keys, kind="mergesort").reset_index(drop=True)
+    dates = _to_ns(data[date_col])
+    groups = data.groupby(
+        ["variable_description", "activity_type"], observed=True
+    ).indices
+    no_rows = np.array([], dtype=np.intp)
+
+    def _date_bounds(sub_dates, start_date, end_date):
+        # The picker sends ISO strings, convert them once and binary search
+        lo = np.searchsorted(sub_dates, _to_ns(start_date))
+        hi = np.searchsorted(sub_dates, _to_ns(end_date), side="right")
+        return lo, hi
+
+    def _filter_rows(touchpoint, activity, start_date, end_date):
+        idx = groups.get((touchpoint, activity), no_rows)
+        lo, hi = _date_bounds(dates[idx], start_date, end_date)
+        return data.take(idx[lo:hi])
+
+    @lru_cache(maxsize=None)
+    def _agg_all(touchpoint, activity):
+        # Aggregate across all groups once per (touchpoint, activity); the date
+        # range is applied afterwards on the (date sorted) aggregated frame.
+        temp = data.take(groups.get((touchpoint, activity), no_rows))
+        temp = temp.groupby(keys, observed=True, as_index=False, sort=False)[
+            ["Spend", "Activity"]
+        ].sum()
+        return temp, _to_ns(temp[date_col])
+
+    template = _default_template()
+
+    if group_col is not None:
+        geo_cats = data[group_col].cat.categories
+
+    # Build the dropdown options once from the (already unique) categories,
+    # they are shared by both layouts
+    vd_opts = [
+        {"label": x, "value": x} for x in data["variable_description"].cat.categories
+    ]
+    at_opts = [{"label": x, "value": x} for x in data["activity_type"].cat.categories]
 
     if group_col is None:
         app.layout = html.Div(
             [
                 dcc.Dropdown(
                     id="touchpoint",
-                    options=[
-                        {"label": x, "value": x}
-                        for x in data["variable_description"].unique()
-                    ],
-                    value=data["variable_description"].unique()[0],
+                    options=vd_opts,
+                    value=vd_default,
                 ),
                 dcc.Dropdown(
                     id="activity",
-                    options=[
-                        {"label": x, "value": x} for x in data["activity_type"].unique()
-                    ],
-                    value=data["activity_type"].unique()[0],
+                    options=at_opts,
+                    value=at_default,
                 ),
                 dcc.Dropdown(
                     id="plot_type",
@@ -80,75 +323,29 @@ def get_spend_vs_activity_plot_interact(
             Input("date_range_picker", "end_date"),
         )
         def update_graph1(touchpoint, activity, plot_type, start_date, end_date):
-            temp = data[
-                (data["variable_description"] == touchpoint)
-                & (data["activity_type"] == activity)
-                & (data[date_col] >= start_date)
-                & (data[date_col] <= end_date)
-            ]
+            temp = _filter_rows(touchpoint, activity, start_date, end_date)
 
-            temp["cost_per_act"] = temp["Spend"] / temp["Activity"]
-            temp["cost_per_act"] = (
-                temp["cost_per_act"].fillna(0).replace([np.inf, -np.inf], 0)
+            temp["cost_per_act"] = _get_cost_per_activity(
+                temp["Spend"].to_numpy(), temp["Activity"].to_numpy()
             )
 
-            cpm_fig = px.line(temp, x=date_col, y="cost_per_act")
-            cpm_fig.update_layout(title_text=" Cost per Activity ")
-            cpm_fig.update_xaxes(title_text="Date")
-
-            if plot_type == "Time Series":
-                fig = make_subplots(specs=[[{"secondary_y": True}]])
-
-                # Add traces
-                fig.add_trace(
-                    go.Scatter(x=temp[date_col], y=temp["Spend"], name="Spends"),
-                    secondary_y=False,
-                )
-
-                fig.add_trace(
-                    go.Scatter(x=temp[date_col], y=temp["Activity"], name="Activity"),
-                    secondary_y=True,
-                )
+            if _is_data_update():
+                return _patch_spend_vs_activity_figures(temp, plot_type, date_col)
 
-                # Add figure title
-                fig.update_layout(title_text="Spends vs. Activity")
-
-                # Set x-axis title
-                fig.update_xaxes(title_text="Date")
-
-                # Set y-axes titles
-                fig.update_yaxes(title_text="<b>Spends</b>", secondary_y=False)
-                fig.update_yaxes(title_text="<b>Activity</b>", secondary_y=True)
-
-            elif plot_type == "Scatter Plot":
-                fig = px.scatter(
-                    temp,
-                    x="Activity",
-                    y="Spend",
-                )
-                fig.update_layout(title_text="Scatter plot Spends vs. Activity")
-                fig.update_xaxes(title_text="Activity")
-                fig.update_yaxes(title_text="Spend")
-
-            return fig, cpm_fig
+            return _spend_vs_activity_figures(temp, plot_type, date_col, template)
 
     else:
         app.layout = html.Div(
             [
                 dcc.Dropdown(
                     id="touchpoint",
-                    options=[
-                        {"label": x, "value": x}
-                        for x in data["variable_description"].unique()
-                    ],
-                    value=data["variable_description"].unique()[0],
+                    options=vd_opts,
+                    value=vd_default,
                 ),
                 dcc.Dropdown(
                     id="activity",
-                    options=[
-                        {"label": x, "value": x} for x in data["activity_type"].unique()
-                    ],
-                    value=data["activity_type"].unique()[0],
+                    options=at_opts,
+                    value=at_default,
                 ),
                 dcc.Dropdown(
                     id="plot_type",
@@ -161,7 +358,9 @@ def get_spend_vs_activity_plot_interact(
                 dcc.Dropdown(
                     id="geo",
                     options=[{"label": "Select all", "value": "all_values"}]
-                    + [{"label": x, "value": x} for x in data[group_col].unique()],
+                    + [
+                        {"label": x, "value": x} for x in data[group_col].cat.categories
+                    ],
                     value="all_values",
                     # multi=True
                 ),
@@ -191,89 +390,24 @@ def get_spend_vs_activity_plot_interact(
         )
         def update_graph1(touchpoint, activity, plot_type, geo, start_date, end_date):
             if geo == "all_values":
-                temp = data[
-                    (data["variable_description"] == touchpoint)
-                    & (data["activity_type"] == activity)
-                    & (data[date_col] >= start_date)
-                    & (data[date_col] <= end_date)
-                ]
-                temp = (
-                    temp.groupby(
-                        [
-                            date_col,
-                            "variable_activity_root",
-                            "variable_description",
-                            "activity_type",
-                        ]
-                    )
-                    .sum(numeric_only=False)
-                    .reset_index()
-                )
+                agg, agg_dates = _agg_all(touchpoint, activity)
+                lo, hi = _date_bounds(agg_dates, start_date, end_date)
+                temp = agg.iloc[lo:hi].copy()
             else:
-                temp = data[
-                    (data["variable_description"] == touchpoint)
-                    & (data["activity_type"] == activity)
-                    & (data[date_col] >= start_date)
-                    & (data[date_col] <= end_date)
-                ]
-                temp = temp[temp[group_col] == geo]
-                temp = (
-                    temp.groupby(
-                        [
-                            date_col,
-                            "variable_activity_root",
-                            "variable_description",
-                            "activity_type",
-                        ]
-                    )
-                    .sum(numeric_only=False)
-                    .reset_index()
-                )
-
-            temp["cost_per_act"] = temp["Spend"] / temp["Activity"]
-            temp["cost_per_act"] = (
-                temp["cost_per_act"].fillna(0).replace([np.inf, -np.inf], 0)
+                temp = _filter_rows(touchpoint, activity, start_date, end_date)
+                temp = temp[_code_mask(temp[group_col].cat.codes.values, geo_cats, geo)]
+                temp = temp.groupby(keys, observed=True, as_index=False, sort=False)[
+                    ["Spend", "Activity"]
+                ].sum()
+
+            temp["cost_per_act"] = _get_cost_per_activity(
+                temp["Spend"].to_numpy(), temp["Activity"].to_numpy()
             )
 
-            cpm_fig = px.line(temp, x=date_col, y="cost_per_act")
-            cpm_fig.update_layout(title_text=" Cost per Activity ")
-            cpm_fig.update_xaxes(title_text="Date")
-
-            if plot_type == "Time Series":
-                fig = make_subplots(specs=[[{"secondary_y": True}]])
+            if _is_data_update():
+                return _patch_spend_vs_activity_figures(temp, plot_type, date_col)
 
-                # Add traces
-                fig.add_trace(
-                    go.Scatter(x=temp[date_col], y=temp["Spend"], name="Spends"),
-                    secondary_y=False,
-                )
-
-                fig.add_trace(
-                    go.Scatter(x=temp[date_col], y=temp["Activity"], name="Activity"),
-                    secondary_y=True,
-                )
-
-                # Add figure title
-                fig.update_layout(title_text="Spends vs. Activity")
-
-                # Set x-axis title
-                fig.update_xaxes(title_text="Date")
-
-                # Set y-axes titles
-                fig.update_yaxes(title_text="<b>Spends</b>", secondary_y=False)
-                fig.update_yaxes(title_text="<b>Activity</b>", secondary_y=True)
-
-            elif plot_type == "Scatter Plot":
-                fig = px.scatter(
-                    temp,
-                    x="Activity",
-                    y="Spend",
-                )
-                fig.update_layout(title_text="Scatter plot Spends vs. Activity")
-                fig.update_xaxes(title_text="Activity")
-                fig.update_yaxes(title_text="Spend")
-
-            return fig, cpm_fig
+            return _spend_vs_activity_figures(temp, plot_type, date_col, template)
 
     # Run app and display datault inline in the notebook
     app.run_server(mode="inline", debug=True, port=port)
@@ -331,7 +465,8 @@ def get_spend_vs_activity_plot(
         end_date = date_range[1]
 
     variable_descriptions = spend_activity_data["variable_description"].unique()
-    if variable_description.lower() not in map(str.lower, variable_descriptions):
+    vd_set = frozenset(x.lower() for x in variable_descriptions)
+    if variable_description.lower() not in vd_set:
         print(
             "'{}' activity type is not available for the given variable\n\
         The availabale activities are: ".format(
@@ -342,14 +477,15 @@ def get_spend_vs_activity_plot(
             print(variable)
         return
 
-    unique_activities = spend_activity_data[
-        (
-            spend_activity_data["variable_description"].str.lower()
-            == variable_description.lower()
-        )
-    ]["activity_type"].unique()
+    # Lower-case the string columns only once, they are reused by every filter
+    vd_match = (
+        spend_activity_data["variable_description"].str.lower()
+        == variable_description.lower()
+    )
+    unique_activities = spend_activity_data[vd_match]["activity_type"].unique()
 
-    if activity_type.lower() not in map(str.lower, unique_activities):
+    at_set = frozenset(x.lower() for x in unique_activities)
+    if activity_type.lower() not in at_set:
         print(
             "'{}' activity type is not available for the given variable\n\
         The availabale activities are: ".format(
@@ -360,36 +496,28 @@ def get_spend_vs_activity_plot(
             print(activity)
         return
 
-    if group_value is None:
-        temp = spend_activity_data[
-            (
-                spend_activity_data["variable_description"].str.lower()
-                == variable_description.lower()
-            )
-            & (
-                spend_activity_data["activity_type"].str.lower()
-                == activity_type.lower()
-            )
-            & (spend_activity_data[date_col] >= start_date)
-            & (spend_activity_data[date_col] <= end_date)
-        ]
-    else:
-        temp = spend_activity_data[
-            (
-                spend_activity_data["variable_description"].str.lower()
-                == variable_description.lower()
-            )
-            & (
-                spend_activity_data["activity_type"].str.lower()
-                == activity_type.lower()
-            )
-            & (spend_activity_data[date_col] >= start_date)
-            & (spend_activity_data[date_col] <= end_date)
-            & (spend_activity_data[group_col] == group_value)
-        ]
+    at_match = spend_activity_data["activity_type"].str.lower() == activity_type.lower()
+    # Fuse the filters into a single query, evaluated with numexpr if available
+    condition = (
+        "@vd_match & @at_match"
+        f" & (`{date_col}` >= @start_date) & (`{date_col}` <= @end_date)"
+    )
+    if group_value is not None:
+        condition += f" & (`{group_col}` == @group_value)"
+    temp = spend_activity_data.query(
+        condition,
+        local_dict={
+            "vd_match": vd_match,
+            "at_match": at_match,
+            "start_date": start_date,
+            "end_date": end_date,
+            "group_value": group_value,
+        },
+    )
 
-    temp["cost_per_act"] = temp["Spend"] / temp["Activity"]
-    temp["cost_per_act"] = temp["cost_per_act"].fillna(0).replace([np.inf, -np.inf], 0)
+    temp["cost_per_act"] = _get_cost_per_activity(
+        temp["Spend"].to_numpy(), temp["Activity"].to_numpy()
+    )
     fig = make_subplots(
         rows=2,
         cols=1,
@@ -402,16 +530,16 @@ def get_spend_vs_activity_plot(
 
     # Add traces
     fig.add_trace(
-        go.Scatter(x=temp[date_col], y=temp["Spend"], name="Spends"),
+        go.Scattergl(x=temp[date_col], y=_plot_values(temp["Spend"]), name="Spends"),
         secondary_y=False,
         row=1,
         col=1,
     )
 
     fig.add_trace(
-        go.Scatter(
+        go.Scattergl(
             x=temp[date_col],
-            y=temp["Activity"],
+            y=_plot_values(temp["Activity"]),
             name="Activity ({})".format(activity_type),
         ),
         secondary_y=True,
@@ -420,7 +548,11 @@ def get_spend_vs_activity_plot(
     )
 
     fig.add_trace(
-        go.Scatter(x=temp[date_col], y=temp["cost_per_act"], name="Cost_Per_Activity"),
+        go.Scattergl(
+            x=temp[date_col],
+            y=_plot_values(temp["cost_per_act"]),
+            name="Cost_Per_Activity",
+        ),
         row=2,
         col=1,
     )
@@ -449,6 +581,44 @@ def get_spend_vs_activity_plot(
     return fig
 
 
+# Filters the quarterly spends of the selected touchpoint (summed over the
+# selected, or all, groups when a group column is present) and builds the
+# line plot in the browser.
+_QUARTERLY_SPENDS_JS = """
+function (store, touchpoint, geo) {
+    var rows = store.records.filter(function (row) {
+        return row.variable_description === touchpoint;
+    });
+    var x, y;
+    if (store.group_col === null) {
+        x = rows.map(function (row) { return row.YEAR_QTR; });
+        y = rows.map(function (row) { return row.value; });
+    } else {
+        var totals = {};
+        rows.forEach(function (row) {
+            if (geo === "all_values" || row[store.group_col] === geo) {
+                totals[row.YEAR_QTR] = (totals[row.YEAR_QTR] || 0) + (row.value || 0);
+            }
+        });
+        x = Object.keys(totals).sort();
+        y = x.map(function (key) { return totals[key]; });
+    }
+    return {
+        data: [{
+            type: "scatter",
+            mode: "lines",
+            x: x,
+            y: y,
+            name: "",
+            showlegend: false,
+            hovertemplate: "YEAR_QTR=%{x}<br>value=%{y}<extra></extra>"
+        }],
+        layout: store.layout
+    };
+}
+"""
+
+
 def get_quarterly_spends_plot_interact(
     data: pd.DataFrame, group_col: str = None, port: int = 8050
 ):
@@ -471,52 +641,67 @@ def get_quarterly_spends_plot_interact(
         Dash app containing the quarterly spend plot.
     """
 
-    app = JupyterDash(__name__)
+    app = JupyterDash(__name__, update_title=None)
+
+    cat_cols = ["variable_description"]
+    if group_col is not None:
+        cat_cols.append(group_col)
+    data = data.assign(**{col: data[col].astype("category") for col in cat_cols})
+
+    # Build the dropdown options once from the (already unique) categories,
+    # they are shared by both layouts
+    vd_opts = [
+        {"label": x, "value": x} for x in data["variable_description"].cat.categories
+    ]
+
+    # The quarterly data is small, ship it to the browser once and filter and
+    # plot it there instead of a server round-trip on every interaction.
+    store = {
+        "records": data[[*cat_cols, "YEAR_QTR", "value"]].to_dict("records"),
+        "group_col": group_col,
+        "layout": {
+            "template": _default_template(),
+            "title": {"text": "Quarterly Spends"},
+            "xaxis": {"title": {"text": "Year Quarter"}},
+            "yaxis": {"title": {"text": "Spend"}},
+        },
+    }
 
     if group_col is None:
         app.layout = html.Div(
             [
+                dcc.Store(id="store", data=store),
                 dcc.Dropdown(
                     id="touchpoint",
-                    options=[
-                        {"label": x, "value": x}
-                        for x in data["variable_description"].unique()
-                    ],
-                    value=data["variable_description"].unique()[0],
+                    options=vd_opts,
+                    value=vd_opts[0]["value"],
                 ),
                 dcc.Graph(id="graph1"),
             ]
         )
 
-        @app.callback(
+        app.clientside_callback(
+            _QUARTERLY_SPENDS_JS,
             Output("graph1", "figure"),
+            Input("store", "data"),
             Input("touchpoint", "value"),
         )
-        def update_graph1(touchpoint):
-            temp = data[(data["variable_description"] == touchpoint)]
-
-            fig = px.line(temp, x="YEAR_QTR", y="value")
-            fig.update_layout(title_text="Quarterly Spends")
-            fig.update_xaxes(title_text="Year Quarter")
-            fig.update_yaxes(title_text="Spend")
-
-            return fig
 
     else:
         app.layout = html.Div(
             [
+                dcc.Store(id="store", data=store),
                 dcc.Dropdown(
                     id="touchpoint",
-                    options=[
-                        {"label": x, "value": x}
-                        for x in data["variable_description"].unique()
-                    ],
-                    value=data["variable_description"].unique()[0],
+                    options=vd_opts,
+                    value=vd_opts[0]["value"],
                 ),
                 dcc.Dropdown(
                     id="geo",
                     options=[{"label": "Select all", "value": "all_values"}]
-                    + [{"label": x, "value": x} for x in data[group_col].unique()],
+                    + [
+                        {"label": x, "value": x} for x in data[group_col].cat.categories
+                    ],
                     value="all_values",
                     # multi=True
                 ),
@@ -524,28 +709,15 @@ def get_quarterly_spends_plot_interact(
             ]
         )
 
-        @app.callback(
+        app.clientside_callback(
+            _QUARTERLY_SPENDS_JS,
             Output("graph1", "figure"),
             [
+                Input("store", "data"),
                 Input("touchpoint", "value"),
                 Input("geo", "value"),
             ],
         )
-        def update_graph1(touchpoint, geo):
-            if geo == "all_values":
-                temp = data[(data["variable_description"] == touchpoint)]
-                temp = temp.groupby(["YEAR_QTR"]).sum(numeric_only=False).reset_index()
-            else:
-                temp = data[(data["variable_description"] == touchpoint)]
-                temp = temp[temp[group_col] == geo]
-                temp = temp.groupby(["YEAR_QTR"]).sum(numeric_only=False).reset_index()
-
-            fig = px.line(temp, x="YEAR_QTR", y="value")
-            fig.update_layout(title_text="Quarterly Spends")
-            fig.update_xaxes(title_text="Year Quarter")
-            fig.update_yaxes(title_text="Spend")
-
-            return fig
 
     # Run app and display datault inline in the notebook
     app.run_server(mode="inline", debug=True, port=port)
@@ -584,7 +756,8 @@ def get_quarterly_spends_plot(
     """
 
     spend_variables = quarterly_spend_data["variable_description"].unique()
-    if spend_variable_description.lower() not in map(str.lower, spend_variables):
+    vd_set = frozenset(x.lower() for x in spend_variables)
+    if spend_variable_description.lower() not in vd_set:
         print(
             "'{}' activity type is not available for the given variable\n\
         The available activities are: ".format(
@@ -650,14 +823,23 @@ def get_actual_vs_predicted_plot_interact(
         Dash app containing a line plot comparing actual values and predicted values.
     """
 
-    data = act_vs_preds.copy()
-
+    # Only the used columns are copied to add the exponentiated values, the
+    # input is used as is otherwise
     if is_log is True:
-        data["actuals"] = np.exp(data["actuals"])
-        data["preds"] = np.exp(data["preds"])
+        data = act_vs_preds[[date_col, group_col]].assign(
+            actuals=np.exp(act_vs_preds["actuals"].to_numpy(dtype=np.float32)),
+            preds=np.exp(act_vs_preds["preds"].to_numpy(dtype=np.float32)),
+        )
+    else:
+        data = act_vs_preds
+    data = _as_contiguous(data, ["actuals", "preds"])
+
+    # Filter on integer category codes rather than comparing strings
+    group_cats = pd.Categorical(data[group_col])
+    group_values = group_cats.codes
 
     # Initialize the app
-    app = JupyterDash(__name__)
+    app = JupyterDash(__name__, update_title=None)
 
     # Define the layout
     app.layout = html.Div(
@@ -666,7 +848,7 @@ def get_actual_vs_predicted_plot_interact(
             dcc.Dropdown(
                 id="dropdown",
                 options=[{"label": "Select All", "value": "select_all"}]
-                + [{"label": g, "value": g} for g in data[group_col].unique()],
+                + [{"label": g, "value": g} for g in group_cats.categories],
                 value="select_all",
                 style={"width": "50%"},
             ),
@@ -674,24 +856,44 @@ def get_actual_vs_predicted_plot_interact(
         ]
     )
 
+    # Aggregate across all groups once, "Select All" is the default selection
+    all_agg = data.groupby(date_col)[["actuals", "preds"]].sum().reset_index()
+
+    template = _default_template()
+
     # Define the callback
     @app.callback(Output("line-plot", "figure"), [Input("dropdown", "value")])
     def update_figure(selected_g):
         if selected_g == "select_all":
-            filtered_df = data.groupby(date_col).sum().reset_index()
+            filtered_df = all_agg
         else:
-            filtered_df = data[data[group_col] == selected_g]
-
-        fig = px.line(
-            filtered_df,
-            x=date_col,
-            y=["actuals", "preds"],
-            color_discrete_sequence=["blue", "orange"],
-        )
+            filtered_df = data[
+                _code_mask(group_values, group_cats.categories, selected_g)
+            ]
 
-        fig.update_layout(
-            title="Actuals vs Prediction", xaxis_title="Date", yaxis_title=f"{dv_col}"
-        )
+        fig = {
+            "data": [
+                {
+                    "type": "scattergl",
+                    "mode": "lines",
+                    "x": filtered_df[date_col],
+                    "y": _plot_values(filtered_df[col]),
+                    "name": col,
+                    "legendgroup": col,
+                    "line": {"color": color},
+                    "hovertemplate": f"variable={col}<br>{date_col}=%{{x}}"
+                    "<br>value=%{y}<extra></extra>",
+                }
+                for col, color in [("actuals", "blue"), ("preds", "orange")]
+            ],
+            "layout": {
+                "template": template,
+                "title": {"text": "Actuals vs Prediction"},
+                "xaxis": {"title": {"text": "Date"}},
+                "yaxis": {"title": {"text": f"{dv_col}"}},
+                "legend": {"title": {"text": "variable"}},
+            },
+        }
 
         return fig
 
@@ -741,11 +943,16 @@ def get_actual_vs_predicted_plot(
     -----
     - If `group_value` is set to "all" or None, the data will be grouped by `date_col` and summed for all group values.
     """
-    data = act_vs_preds.copy()
-
+    # Only the used columns are copied to add the exponentiated values, the
+    # input is used as is otherwise
     if is_log is True:
-        data["actuals"] = np.exp(data["actuals"])
-        data["preds"] = np.exp(data["preds"])
+        keep = [date_col] if group_col is None else [date_col, group_col]
+        data = act_vs_preds[keep].assign(
+            actuals=np.exp(act_vs_preds["actuals"].to_numpy(dtype=np.float32)),
+            preds=np.exp(act_vs_preds["preds"].to_numpy(dtype=np.float32)),
+        )
+    else:
+        data = act_vs_preds
 
     if group_value == "all" or group_value is None:
         filtered_df = data.groupby(date_col).sum().reset_index()
@@ -761,6 +968,7 @@ def get_actual_vs_predicted_plot(
         x=date_col,
         y=["actuals", "preds"],
         color_discrete_sequence=["blue", "orange"],
+        render_mode="webgl",
     )
 
     fig.update_layout(